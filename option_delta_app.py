@@ -6,55 +6,77 @@ Option Delta查询工具
 运行: streamlit run option_delta_app.py
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import streamlit as st
 import yfinance as yf
-from datetime import datetime, timedelta
-import pandas as pd
+from datetime import date
 import numpy as np
+from scipy.special import ndtr
+
+# 缓存的网络请求（Streamlit 每次交互都会重跑脚本，避免重复访问 Yahoo）
+@st.cache_data(ttl=60)
+def fetch_hist(ticker):
+    """获取30天历史行情（一次请求同时得到现价和历史波动率）"""
+    return yf.Ticker(ticker).history(period='30d')
+
+@st.cache_data(ttl=300)
+def fetch_expirations(ticker):
+    """获取可用到期日"""
+    return yf.Ticker(ticker).options
+
+@st.cache_data(ttl=60)
+def fetch_option_chain(ticker, exp):
+    """获取指定到期日的期权链（返回可序列化的 DataFrame 对）"""
+    chain = yf.Ticker(ticker).option_chain(exp)
+    return chain.calls, chain.puts
+
+def _col_at(df, col, idx):
+    """按位置取单个标量（.iat 是最快的标量访问路径），列缺失时返回 None"""
+    return df[col].iat[idx] if col in df.columns else None
+
+@lru_cache(maxsize=4096)
+def _cdf_q(d1_q):
+    """量化到1e-4的标量正态 CDF（滑杆式快速改参数时直接命中缓存）"""
+    return float(ndtr(d1_q))
 
 # Black-Scholes 模型计算 Delta
 def black_scholes_delta(S, K, T, r, sigma, option_type='call'):
-    """计算期权 Delta"""
-    from scipy.stats import norm
-    
+    """计算期权 Delta（K 可以是标量或整条行权价序列的 ndarray，广播计算）"""
     if T <= 0:
         return 1.0 if option_type == 'call' and S > K else 0.0 if option_type == 'put' and S < K else 0.5
-    
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    
+
+    # T、sigma 均为标量：不变量先用 math 标量运算算好，免去 ufunc 分发
+    sigma2 = sigma * sigma
+    drift = (r + 0.5 * sigma2) * T
+    denom_inv = 1.0 / (sigma * math.sqrt(T))
+    # 原地运算，避免在大序列上产生临时数组
+    d1 = np.log(S / K)
+    d1 += drift
+    d1 *= denom_inv
+
+    # 标量走量化缓存（delta 误差 <= 5e-5），序列走向量化 ndtr
+    cdf = _cdf_q(round(float(d1), 4)) if np.ndim(d1) == 0 else ndtr(d1)
+
     if option_type.lower() == 'call':
-        return norm.cdf(d1)
+        return cdf
     else:
-        return norm.cdf(d1) - 1
-
-def get_option_delta(ticker, expiration_date, strike, option_type, volatility=None):
-    """获取期权 Delta"""
-    stock = yf.Ticker(ticker)
-    
-    # 获取当前股价
-    current_price = stock.history(period='1d')['Close'].iloc[-1]
-    
-    # 计算到期天数
-    exp_date = datetime.strptime(expiration_date, '%Y-%m-%d')
-    today = datetime.now()
-    T = (exp_date - today).days / 365.0
-    
-    if T <= 0:
-        return None, "到期日期已过"
-    
-    # 如果没有提供波动率，使用历史波动率
-    if volatility is None:
-        # 估算隐含波动率（使用30天历史波动率）
-        hist_vol = stock.history(period='30d')['Close'].pct_change().std() * np.sqrt(252)
-        volatility = max(hist_vol, 0.1)  # 最低10%波动率
-    
-    # 假设无风险利率为 5%
-    r = 0.05
-    
-    # 计算 Delta
-    delta = black_scholes_delta(current_price, float(strike), T, r, volatility, option_type)
-    
-    return delta, current_price
+        return cdf - 1
+
+@st.cache_data(ttl=300)
+def compute_delta(S, K, T, r, sigma, option_type):
+    """纯数值的 Delta 计算，输入不变时直接命中缓存（K 可为标量或序列）"""
+    return black_scholes_delta(S, np.asarray(K, dtype=float), T, r, sigma, option_type)
+
+def option_T(expiration_date):
+    """到期日字符串 -> 年化剩余期限"""
+    # fromisoformat 走专用 C 解析路径，且按整天计算，T 不随时刻抖动
+    return (date.fromisoformat(expiration_date) - date.today()).days / 365.0
+
+# 假设无风险利率为 5%
+RISK_FREE_RATE = 0.05
 
 # Streamlit 界面
 st.set_page_config(page_title="期权 Delta 查询", page_icon="📈", layout="centered")
@@ -78,54 +100,59 @@ st.markdown("---")
 
 # 获取期权链
 try:
-    stock = yf.Ticker(ticker)
-    expirations = stock.options
-    
+    expirations = fetch_expirations(ticker)
+
     if len(expirations) == 0:
         st.error(f"❌ {ticker} 没有可用的期权数据")
     else:
-        # 显示可用到期日
-        st.write("📅 可选到期日:")
-        cols = st.columns(4)
-        selected_exp = None
-        
-        for i, exp in enumerate(expirations[:12]):  # 最多显示12个
-            with cols[i % 4]:
-                if st.button(exp, key=f"exp_{i}"):
-                    selected_exp = exp
-        
+        # 并行预取前几个到期日的期权链，之后的点击直接命中缓存
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(lambda e: fetch_option_chain(ticker, e), expirations[:4]))
+
+        # 到期日选择：单个控件代替12个按钮，选中状态跨重跑自动保留
+        selected_exp = st.radio("📅 可选到期日", expirations[:12], horizontal=True, key="exp_pick")
+
         st.markdown("---")
         
         if selected_exp:
             st.success(f"选择到期日: {selected_exp}")
             
             # 获取该到期日的期权链
-            opt = stock.option_chain(selected_exp)
-            
+            calls, puts = fetch_option_chain(ticker, selected_exp)
+
             if option_type == "Call":
-                options = opt.calls
+                options = calls
             else:
-                options = opt.puts
-            
+                options = puts
+
+            # 行权价列提前转成 ndarray，后续查找全走 NumPy
+            strikes = options['strike'].to_numpy()
+
             # 输入行权价
-            strike = st.number_input("行权价 (Strike Price)", min_value=0.0, step=0.5, value=float(options['strike'].iloc[len(options)//2] if len(options) > 0 else 100.0))
-            
-            # 搜索最接近的期权
-            closest = options.iloc[(options['strike'] - strike).abs().argsort()[:1]]
-            
-            if len(closest) > 0:
-                row = closest.iloc[0]
-                
+            strike = st.number_input("行权价 (Strike Price)", min_value=0.0, step=0.5, value=float(strikes[len(strikes)//2]) if len(strikes) > 0 else 100.0)
+
+            # 搜索最接近的期权（线性 argmin，无需整列排序）
+            if len(strikes) > 0:
+                idx = int(np.abs(strikes - strike).argmin())
+                sel_strike = float(strikes[idx])
+
                 st.markdown("### 📊 期权信息")
-                
-                # 显示当前股价
-                current_price = stock.history(period='1d')['Close'].iloc[-1]
+
+                # 现价和历史波动率来自同一份30天行情
+                hist = fetch_hist(ticker)
+                current_price = hist['Close'].iloc[-1]
+                hist_vol = hist['Close'].pct_change().std() * np.sqrt(252)
                 st.write(f"**当前股价:** ${current_price:.2f}")
-                st.write(f"**行权价:** ${row['strike']:.2f}")
+                st.write(f"**行权价:** ${sel_strike:.2f}")
                 st.write(f"**到期日:** {selected_exp}")
-                
-                # 计算 Delta
-                delta, price = get_option_delta(ticker, selected_exp, row['strike'], option_type)
+
+                # 计算 Delta（到期和波动率在界面层确定，数值部分走缓存）
+                T = option_T(selected_exp)
+                if T <= 0:
+                    delta = None
+                else:
+                    volatility = max(hist_vol, 0.1)  # 最低10%波动率
+                    delta = float(compute_delta(current_price, sel_strike, T, RISK_FREE_RATE, volatility, option_type))
                 
                 if delta is not None:
                     st.markdown("### 🎯 Delta 值")
@@ -148,12 +175,20 @@ try:
                             st.info("❤️ 深度虚值期权 (OTM)")
                     
                     # 其他信息
-                    st.write(f"**隐含波动率:** {row.get('impliedVolatility', 'N/A'):.2%}" if row.get('impliedVolatility') else "**隐含波动率:** N/A")
-                    st.write(f"**理论价格:** ${row.get('lastPrice', 0):.2f}" if row.get('lastPrice') else "**最新价格:** N/A")
-                    st.write(f"**未平仓合约:** {row.get('openInterest', 'N/A'):,}" if row.get('openInterest') else "**未平仓合约:** N/A")
-                    
+                    iv = _col_at(options, 'impliedVolatility', idx)
+                    lp = _col_at(options, 'lastPrice', idx)
+                    oi = _col_at(options, 'openInterest', idx)
+                    st.write(f"**隐含波动率:** {iv:.2%}" if iv else "**隐含波动率:** N/A")
+                    st.write(f"**理论价格:** ${lp:.2f}" if lp else "**最新价格:** N/A")
+                    st.write(f"**未平仓合约:** {oi:,}" if oi else "**未平仓合约:** N/A")
+
+                    # 整条行权价序列的 Delta（一次广播计算）
+                    ladder = compute_delta(current_price, strikes, T, RISK_FREE_RATE, volatility, option_type)
+                    st.markdown("### 📋 全部行权价 Delta")
+                    st.dataframe({'strike': strikes, 'delta': ladder})
+
                 else:
-                    st.error(price)  # 错误信息
+                    st.error("到期日期已过")
                     
 except Exception as e:
     st.error(f"❌ 错误: {str(e)}")
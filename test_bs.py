@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+_bs 内核与 scipy.special.ndtr 的数值一致性测试
+
+A&S 7.1.26 逼近的绝对误差上界约 7.5e-8；这里用 1e-6 的容差校验
+标量和批量两条路径（含 d1 < 0 的对称分支和 Put 分支）。
+
+运行: pytest test_bs.py
+"""
+
+import math
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+import _bs
+
+TOL = 1e-6
+
+# (S, K, T, r, sigma) 覆盖实值/平值/深度虚值（d1 正负均有）和长短期限
+PARAMS = [
+    (100.0, 80.0, 0.5, 0.05, 0.2),
+    (100.0, 100.0, 0.5, 0.05, 0.2),
+    (100.0, 130.0, 0.5, 0.05, 0.2),
+    (50.0, 55.0, 0.05, 0.05, 0.4),
+    (10.0, 200.0, 1.0, 0.01, 0.15),
+    (200.0, 10.0, 2.0, 0.08, 0.6),
+]
+
+def _d1(S, K, T, r, sigma):
+    return (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+
+@pytest.mark.parametrize("S, K, T, r, sigma", PARAMS)
+def test_delta_call_matches_ndtr(S, K, T, r, sigma):
+    expected = float(ndtr(_d1(S, K, T, r, sigma)))
+    assert _bs.delta_call(S, K, T, r, sigma) == pytest.approx(expected, abs=TOL)
+
+@pytest.mark.parametrize("S, K, T, r, sigma", PARAMS)
+def test_delta_put_matches_ndtr(S, K, T, r, sigma):
+    expected = float(ndtr(_d1(S, K, T, r, sigma))) - 1.0
+    assert _bs.delta_put(S, K, T, r, sigma) == pytest.approx(expected, abs=TOL)
+
+def test_delta_many_matches_ndtr():
+    S, T, r, sigma = 100.0, 0.5, 0.05, 0.25
+    K = np.linspace(40.0, 250.0, 211)  # 整条行权价序列，d1 跨越正负
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+
+    np.testing.assert_allclose(
+        _bs.delta_many(S, K, T, r, sigma, True), ndtr(d1), atol=TOL)
+    np.testing.assert_allclose(
+        _bs.delta_many(S, K, T, r, sigma, False), ndtr(d1) - 1.0, atol=TOL)